@@ -38,6 +38,10 @@ hiddenimports = [
     'xml.etree.ElementTree',
     'html.parser',
     'urllib3',
+    'requests_toolbelt',
+    'requests_toolbelt.multipart.encoder',
+    'orjson',
+    'python_calamine',
     'certifi',
     'charset_normalizer',
     'idna',